@@ -10,6 +10,7 @@ Features:
 - Dependency health checks (database, cache, external services)
 - Graceful degradation
 - Configurable timeouts
+- Short-lived result caching to absorb frequent probes
 - Detailed health information (optional)
 
 Usage with FastAPI:
@@ -32,21 +33,59 @@ Usage with Flask:
 
     app = Flask(__name__)
     app.register_blueprint(create_flask_blueprint())
+
+Installation:
+    pip install orjson  # optional, faster JSON encoding of health responses
 """
 
 import asyncio
+import concurrent.futures
+import json
 import os
+import threading
 import time
+import weakref
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from enum import Enum
 from functools import wraps
-from typing import Any, Awaitable, Callable, Dict, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+__all__ = [
+    "HealthStatus",
+    "HealthCheckResult",
+    "HealthResponse",
+    "register_check",
+    "register_check_fn",
+    "unregister_check",
+    "mark_started",
+    "mark_not_started",
+    "is_started",
+    "run_check",
+    "run_all_checks",
+    "get_overall_status",
+    "create_response",
+    "close_http_session",
+    "health_router",
+    "create_flask_blueprint",
+    "create_database_check",
+    "create_cache_check",
+    "create_external_service_check",
+    "create_memory_check",
+]
 
 # Configuration
 CHECK_TIMEOUT = int(os.getenv("HEALTH_CHECK_TIMEOUT", "5000")) / 1000  # Convert to seconds
 INCLUDE_DETAILS = os.getenv("HEALTH_INCLUDE_DETAILS", "true").lower() == "true"
 SERVICE_VERSION = os.getenv("SERVICE_VERSION", os.getenv("npm_package_version", "0.0.0"))
+HEALTH_CHECK_CONCURRENCY = int(os.getenv("HEALTH_CHECK_CONCURRENCY", "8"))  # Max in-flight checks
+HEALTH_CACHE_TTL = float(os.getenv("HEALTH_CACHE_TTL_MS", "2000")) / 1000  # Convert to seconds
+# Overall budget for a run of all checks; keep below the probe's timeoutSeconds
+HEALTH_TOTAL_DEADLINE = float(os.getenv("HEALTH_TOTAL_DEADLINE_MS", "4500")) / 1000  # Convert to seconds
 
 
 class HealthStatus(str, Enum):
@@ -57,7 +96,15 @@ class HealthStatus(str, Enum):
     DEGRADED = "degraded"
 
 
-@dataclass
+# Module-level aliases for hot paths. Comparisons use == (not `is`) so checks
+# returning plain strings like status="healthy" are still classified correctly.
+_HEALTHY = HealthStatus.HEALTHY
+_DEGRADED = HealthStatus.DEGRADED
+_UNHEALTHY = HealthStatus.UNHEALTHY
+_STATUS_STR = {status: status.value for status in HealthStatus}
+
+
+@dataclass(slots=True, eq=False, repr=False)
 class HealthCheckResult:
     """Result of a single health check."""
 
@@ -66,22 +113,57 @@ class HealthCheckResult:
     latency_ms: Optional[float] = None
     details: Optional[Dict[str, Any]] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for the health response body."""
+        return {
+            "status": _STATUS_STR[self.status],
+            "message": self.message,
+            "latency_ms": self.latency_ms,
+            "details": self.details,
+        }
+
+
+# Unbound serializer, avoids creating a bound method per result in create_response
+_result_to_dict = HealthCheckResult.to_dict
+
+# Timestamp cache: (epoch second, ISO string), refreshed at most once per second.
+# Replaced as a whole so concurrent readers never see a half-updated pair.
+_ts_cache: Tuple[int, str] = (0, "")
+
 
-@dataclass
+def _iso_now() -> str:
+    """Current UTC time as an ISO 8601 string with 1-second resolution."""
+    global _ts_cache
+    now = int(time.time())
+    cached = _ts_cache
+    if now != cached[0]:
+        cached = (now, time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(now)))
+        _ts_cache = cached
+    return cached[1]
+
+
+@dataclass(slots=True, eq=False, repr=False)
 class HealthResponse:
     """Overall health response."""
 
     status: HealthStatus
-    timestamp: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    timestamp: str = field(default_factory=_iso_now)
     version: str = SERVICE_VERSION
     uptime: int = 0
     checks: Optional[Dict[str, HealthCheckResult]] = None
 
 
 # Global state
-_is_started = False
+_is_started = False  # Plain bool: reads/writes are atomic under the GIL, no lock needed
 _start_time = time.time()
 _checks: Dict[str, Callable[[], Awaitable[HealthCheckResult]]] = {}
+_cache: Dict[str, Tuple[float, HealthCheckResult]] = {}
+_sessions: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_bg_loop: Optional[asyncio.AbstractEventLoop] = None
+_bg_loop_pid: Optional[int] = None
+_bg_loop_lock = threading.Lock()
+_sem: Optional[asyncio.Semaphore] = None
+_sem_loop: Optional[asyncio.AbstractEventLoop] = None
 
 
 def register_check(
@@ -101,6 +183,7 @@ def register_check(
         func: Callable[[], Awaitable[HealthCheckResult]],
     ) -> Callable[[], Awaitable[HealthCheckResult]]:
         _checks[name] = func
+        _cache.pop(name, None)
         return func
 
     return decorator
@@ -109,11 +192,13 @@ def register_check(
 def register_check_fn(name: str, check: Callable[[], Awaitable[HealthCheckResult]]) -> None:
     """Register a health check function directly."""
     _checks[name] = check
+    _cache.pop(name, None)
 
 
 def unregister_check(name: str) -> None:
     """Unregister a health check."""
     _checks.pop(name, None)
+    _cache.pop(name, None)
 
 
 def mark_started() -> None:
@@ -133,48 +218,102 @@ def is_started() -> bool:
     return _is_started
 
 
+def _get_semaphore() -> asyncio.Semaphore:
+    """Get the check concurrency semaphore, created lazily since it binds to the running loop."""
+    global _sem, _sem_loop
+    loop = asyncio.get_running_loop()
+    if _sem is None or _sem_loop is not loop:
+        _sem = asyncio.Semaphore(HEALTH_CHECK_CONCURRENCY)
+        _sem_loop = loop
+    return _sem
+
+
 async def run_check(name: str, check: Callable[[], Awaitable[HealthCheckResult]]) -> HealthCheckResult:
-    """Run a health check with timeout."""
-    start = time.time()
-    try:
-        result = await asyncio.wait_for(check(), timeout=CHECK_TIMEOUT)
-        if result.latency_ms is None:
-            result.latency_ms = (time.time() - start) * 1000
-        return result
-    except asyncio.TimeoutError:
-        return HealthCheckResult(
-            status=HealthStatus.UNHEALTHY,
-            message="Health check timeout",
-            latency_ms=(time.time() - start) * 1000,
-        )
-    except Exception as e:
-        return HealthCheckResult(
-            status=HealthStatus.UNHEALTHY,
-            message=str(e),
-            latency_ms=(time.time() - start) * 1000,
-        )
+    """
+    Run a health check with timeout, bounded by HEALTH_CHECK_CONCURRENCY.
+
+    Results are cached per check for HEALTH_CACHE_TTL so frequent probes
+    don't hit dependencies on every request.
+    """
+    cached = _cache.get(name)
+    if cached is not None and time.monotonic() - cached[0] < HEALTH_CACHE_TTL:
+        return cached[1]
+
+    async with _get_semaphore():
+        start = time.time()
+        try:
+            result = await asyncio.wait_for(check(), timeout=CHECK_TIMEOUT)
+            if result.latency_ms is None:
+                result.latency_ms = (time.time() - start) * 1000
+        except asyncio.TimeoutError:
+            result = HealthCheckResult(
+                status=HealthStatus.UNHEALTHY,
+                message="Health check timeout",
+                latency_ms=(time.time() - start) * 1000,
+            )
+        except Exception as e:
+            result = HealthCheckResult(
+                status=HealthStatus.UNHEALTHY,
+                message=str(e),
+                latency_ms=(time.time() - start) * 1000,
+            )
+
+    _cache[name] = (time.monotonic(), result)
+    return result
+
+
+def _deadline_exceeded() -> HealthCheckResult:
+    return HealthCheckResult(
+        status=HealthStatus.UNHEALTHY,
+        message="Health check deadline exceeded",
+        latency_ms=HEALTH_TOTAL_DEADLINE * 1000,
+    )
 
 
 async def run_all_checks() -> Dict[str, HealthCheckResult]:
-    """Run all registered health checks."""
-    results = {}
-    tasks = {name: run_check(name, check) for name, check in _checks.items()}
+    """Run all registered health checks concurrently, within HEALTH_TOTAL_DEADLINE."""
+    # Snapshot so checks registered mid-run don't affect this run
+    items = tuple(_checks.items())
+    if not items:
+        return {}
+
+    names = [name for name, _ in items]
+    tasks = [asyncio.ensure_future(run_check(name, check)) for name, check in items]
+    # asyncio.wait (not gather) so checks that finished in time keep their results
+    # when the deadline cancels the rest
+    try:
+        _, pending = await asyncio.wait(tasks, timeout=HEALTH_TOTAL_DEADLINE)
+    finally:
+        # Also reached when the caller is cancelled (e.g. client disconnect)
+        for task in tasks:
+            if not task.done():
+                task.cancel()
 
-    for name, task in tasks.items():
-        results[name] = await task
+    results = {}
+    for name, task in zip(names, tasks):
+        if task in pending:
+            result = _deadline_exceeded()
+        elif task.cancelled():
+            result = HealthCheckResult(status=HealthStatus.UNHEALTHY, message="Health check cancelled")
+        elif task.exception() is not None:
+            result = HealthCheckResult(status=HealthStatus.UNHEALTHY, message=str(task.exception()))
+        else:
+            result = task.result()
+        results[name] = result
 
     return results
 
 
 def get_overall_status(results: Dict[str, HealthCheckResult]) -> HealthStatus:
     """Determine overall status from check results."""
-    statuses = [r.status for r in results.values()]
-
-    if HealthStatus.UNHEALTHY in statuses:
-        return HealthStatus.UNHEALTHY
-    if HealthStatus.DEGRADED in statuses:
-        return HealthStatus.DEGRADED
-    return HealthStatus.HEALTHY
+    any_degraded = False
+    for result in results.values():
+        status = result.status
+        if status == _UNHEALTHY:
+            return _UNHEALTHY
+        if status == _DEGRADED:
+            any_degraded = True
+    return _DEGRADED if any_degraded else _HEALTHY
 
 
 def create_response(
@@ -183,99 +322,185 @@ def create_response(
 ) -> Dict[str, Any]:
     """Create health response dictionary."""
     response = {
-        "status": status.value,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "status": _STATUS_STR[status],
+        "timestamp": _iso_now(),
         "version": SERVICE_VERSION,
         "uptime": int(time.time() - _start_time),
     }
 
     if INCLUDE_DETAILS and checks:
-        response["checks"] = {
-            name: {
-                "status": result.status.value,
-                "message": result.message,
-                "latency_ms": result.latency_ms,
-                "details": result.details,
-            }
-            for name, result in checks.items()
-        }
+        response["checks"] = {name: _result_to_dict(result) for name, result in checks.items()}
 
     return response
 
 
+def _json_body(content: Dict[str, Any]) -> bytes:
+    """
+    Encode a response body, using orjson when it is installed.
+
+    Values neither encoder handles natively (timedelta, Decimal, sets, ...) in
+    check details are rendered with str() rather than failing the probe.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. integers over 64 bits; json handles them
+    return json.dumps(content, separators=(",", ":"), default=str).encode()
+
+
+# Liveness body cache: (epoch second, encoded body). Timestamp and uptime only
+# have 1-second resolution, so the body is re-encoded at most once per second.
+_live_cache: Tuple[int, bytes] = (0, b"")
+
+
+def _live_body() -> bytes:
+    """Encoded /live response body, refreshed at most once per second."""
+    global _live_cache
+    now = int(time.time())
+    cached = _live_cache
+    if now != cached[0]:
+        cached = (now, _json_body(create_response(_HEALTHY)))
+        _live_cache = cached
+    return cached[1]
+
+
+# Shared HTTP session for external service checks
+def _get_session() -> Any:
+    """Get the aiohttp session for the running loop, creating it on first use."""
+    import aiohttp
+
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=CHECK_TIMEOUT),
+            connector=aiohttp.TCPConnector(limit=HEALTH_CHECK_CONCURRENCY, ttl_dns_cache=300),
+        )
+        _sessions[loop] = session
+    return session
+
+
+async def close_http_session() -> None:
+    """
+    Close the shared HTTP session for the running loop.
+
+    Registered as a shutdown handler on the FastAPI router; call it yourself
+    on shutdown when using the checks elsewhere.
+    """
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
+
 # FastAPI router
 try:
     from fastapi import APIRouter, Response
 
     health_router = APIRouter(prefix="/health", tags=["health"])
+    health_router.add_event_handler("shutdown", close_http_session)
+
+    def _json_response(content: Dict[str, Any], status_code: int = 200) -> Response:
+        # Pre-encoded body skips FastAPI's jsonable_encoder pass over the dict
+        return Response(content=_json_body(content), status_code=status_code, media_type="application/json")
 
     @health_router.get("/live")
     async def liveness():
         """Liveness probe - Is the application alive?"""
-        return create_response(HealthStatus.HEALTHY)
+        return Response(content=_live_body(), media_type="application/json")
 
     @health_router.get("/ready")
-    async def readiness(response: Response):
+    async def readiness():
         """Readiness probe - Is the application ready to serve traffic?"""
         results = await run_all_checks()
         status = get_overall_status(results)
 
-        if status == HealthStatus.UNHEALTHY:
-            response.status_code = 503
-
-        return create_response(status, results)
+        return _json_response(
+            create_response(status, results),
+            status_code=503 if status == HealthStatus.UNHEALTHY else 200,
+        )
 
     @health_router.get("/startup")
-    async def startup(response: Response):
+    async def startup():
         """Startup probe - Has the application finished starting?"""
         if _is_started:
-            return create_response(HealthStatus.HEALTHY)
+            return _json_response(create_response(HealthStatus.HEALTHY))
 
-        response.status_code = 503
-        return create_response(
-            HealthStatus.UNHEALTHY,
-            {"startup": HealthCheckResult(status=HealthStatus.UNHEALTHY, message="Application is still starting")},
+        return _json_response(
+            create_response(
+                HealthStatus.UNHEALTHY,
+                {"startup": HealthCheckResult(status=HealthStatus.UNHEALTHY, message="Application is still starting")},
+            ),
+            status_code=503,
         )
 
     @health_router.get("")
-    async def health(response: Response):
+    async def health():
         """Combined health endpoint."""
         if not _is_started:
-            response.status_code = 503
-            return create_response(
-                HealthStatus.UNHEALTHY,
-                {"startup": HealthCheckResult(status=HealthStatus.UNHEALTHY, message="Starting")},
+            return _json_response(
+                create_response(
+                    HealthStatus.UNHEALTHY,
+                    {"startup": HealthCheckResult(status=HealthStatus.UNHEALTHY, message="Starting")},
+                ),
+                status_code=503,
             )
 
         results = await run_all_checks()
         status = get_overall_status(results)
 
-        if status == HealthStatus.UNHEALTHY:
-            response.status_code = 503
-
-        return create_response(status, results)
+        return _json_response(
+            create_response(status, results),
+            status_code=503 if status == HealthStatus.UNHEALTHY else 200,
+        )
 
 except ImportError:
     health_router = None
 
 
 # Flask blueprint
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the event loop used to run async checks from sync code, starting it on first use.
+
+    The loop is owned by the process that started it: a forked worker (e.g.
+    gunicorn --preload) inherits the loop object but not its thread, so it
+    starts its own.
+    """
+    global _bg_loop, _bg_loop_pid
+    with _bg_loop_lock:
+        if _bg_loop is None or _bg_loop_pid != os.getpid():
+            _bg_loop = asyncio.new_event_loop()
+            _bg_loop_pid = os.getpid()
+            threading.Thread(target=_bg_loop.run_forever, name="health-checks", daemon=True).start()
+    return _bg_loop
+
+
+def _run_all_checks_sync() -> Dict[str, HealthCheckResult]:
+    """Run all checks on the background loop and wait for the results."""
+    fut = asyncio.run_coroutine_threadsafe(run_all_checks(), _get_background_loop())
+    try:
+        # run_all_checks() returns by HEALTH_TOTAL_DEADLINE; the margin covers loop scheduling
+        return fut.result(timeout=HEALTH_TOTAL_DEADLINE + 1)
+    except concurrent.futures.TimeoutError:
+        fut.cancel()
+        return {name: _deadline_exceeded() for name in tuple(_checks)}
+
+
 def create_flask_blueprint():
     """Create Flask blueprint for health endpoints."""
-    from flask import Blueprint, jsonify
+    from flask import Blueprint, Response, jsonify
 
     bp = Blueprint("health", __name__, url_prefix="/health")
 
     @bp.route("/live")
     def liveness():
-        return jsonify(create_response(HealthStatus.HEALTHY))
+        return Response(_live_body(), mimetype="application/json")
 
     @bp.route("/ready")
     def readiness():
-        # Run async checks in sync context
-        loop = asyncio.new_event_loop()
-        results = loop.run_until_complete(run_all_checks())
-        loop.close()
+        # Run async checks on the shared background loop
+        results = _run_all_checks_sync()
 
         status = get_overall_status(results)
         response = jsonify(create_response(status, results))
@@ -311,9 +536,7 @@ def create_flask_blueprint():
             response.status_code = 503
             return response
 
-        loop = asyncio.new_event_loop()
-        results = loop.run_until_complete(run_all_checks())
-        loop.close()
+        results = _run_all_checks_sync()
 
         status = get_overall_status(results)
         response = jsonify(create_response(status, results))
@@ -384,17 +607,16 @@ def create_external_service_check(url: str) -> Callable[[], Awaitable[HealthChec
             "https://api.payment.com/health"
         ))
     """
-    import aiohttp
+    import aiohttp  # noqa: F401 - fail at registration, not on every probe, if missing
 
     async def check() -> HealthCheckResult:
         start = time.time()
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=CHECK_TIMEOUT)) as resp:
-                return HealthCheckResult(
-                    status=HealthStatus.HEALTHY if resp.ok else HealthStatus.DEGRADED,
-                    latency_ms=(time.time() - start) * 1000,
-                    details={"status_code": resp.status},
-                )
+        async with _get_session().get(url) as resp:
+            return HealthCheckResult(
+                status=HealthStatus.HEALTHY if resp.ok else HealthStatus.DEGRADED,
+                latency_ms=(time.time() - start) * 1000,
+                details={"status_code": resp.status},
+            )
 
     return check
 
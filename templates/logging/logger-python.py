@@ -26,36 +26,69 @@ Environment Variables:
     LOG_LEVEL - Logging level (default: INFO)
     ENVIRONMENT - Environment (development enables pretty printing)
     SERVICE_NAME - Service name for logs (default: app)
+    LOG_TB_MAX_FRAMES - Max traceback frames kept when serializing errors; 0 keeps only the
+        exception line (default: 20)
+    LOG_STACK_INFO - Render stack_info=True stacks (default: false in development, true otherwise)
+    LOG_BUFFERED - Buffer stdout writes and flush periodically (default: false). Trade-off:
+        up to LOG_FLUSH_INTERVAL_MS of logs can be lost if the process is killed without
+        running atexit handlers.
+    LOG_FLUSH_INTERVAL_MS - Flush interval for buffered output (default: 100)
 
 Installation:
     pip install structlog python-json-logger
+    pip install orjson  # optional, faster JSON rendering in production
 """
 
+import asyncio
+import atexit
 import json
 import logging
 import os
 import sys
+import threading
 import time
 import traceback
 from contextlib import contextmanager
-from datetime import datetime, timezone
 from functools import wraps
-from typing import Any, Callable, Dict, Generator, Optional, TypeVar
+from typing import Any, Callable, Dict, Generator, Optional, Tuple, TypeVar
 from uuid import uuid4
 
 import structlog
 from opentelemetry import trace
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configuration from environment
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
 SERVICE_NAME = os.getenv("SERVICE_NAME", os.getenv("OTEL_SERVICE_NAME", "app"))
 ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
 IS_DEVELOPMENT = ENVIRONMENT == "development"
+LOG_TB_MAX_FRAMES = int(os.getenv("LOG_TB_MAX_FRAMES", "20"))
+_SERVICE_CTX = {"service": SERVICE_NAME, "environment": ENVIRONMENT}
+LOG_STACK_INFO = os.getenv("LOG_STACK_INFO", "false" if IS_DEVELOPMENT else "true").lower() == "true"
+LOG_BUFFERED = os.getenv("LOG_BUFFERED", "false").lower() == "true"
+LOG_FLUSH_INTERVAL = int(os.getenv("LOG_FLUSH_INTERVAL_MS", "100")) / 1000  # Convert to seconds
 
 # Type variable for generic function return types
 T = TypeVar("T")
 
 
+# Set once a real TracerProvider is installed; until then trace lookups are skipped
+_tracing_enabled = False
+
+
+def _is_tracing_enabled() -> bool:
+    """Check whether an SDK TracerProvider has been installed (sticky once true)."""
+    global _tracing_enabled
+    if not _tracing_enabled:
+        provider = trace.get_tracer_provider()
+        _tracing_enabled = not isinstance(provider, (trace.ProxyTracerProvider, trace.NoOpTracerProvider))
+    return _tracing_enabled
+
+
 def get_trace_context() -> Dict[str, str]:
     """Get OpenTelemetry trace context for correlation."""
     span = trace.get_current_span()
@@ -63,26 +96,54 @@ def get_trace_context() -> Dict[str, str]:
         return {}
 
     ctx = span.get_span_context()
+    if not ctx.trace_id:
+        return {}
     return {
-        "trace_id": format(ctx.trace_id, "032x"),
-        "span_id": format(ctx.span_id, "016x"),
+        "trace_id": "%032x" % ctx.trace_id,
+        "span_id": "%016x" % ctx.span_id,
     }
 
 
-def serialize_error(error: BaseException) -> Dict[str, Any]:
-    """Safely serialize an exception for logging."""
-    return {
+def _format_traceback(error: BaseException) -> str:
+    """Format the innermost LOG_TB_MAX_FRAMES frames of an exception's traceback."""
+    lines = traceback.format_exception_only(type(error), error)
+    if LOG_TB_MAX_FRAMES <= 0:
+        return "".join(lines)
+    frames = list(traceback.walk_tb(error.__traceback__))[-LOG_TB_MAX_FRAMES:]
+    if not frames:
+        return "".join(lines)
+    return "".join(
+        [
+            "Traceback (most recent call last):\n",
+            *traceback.StackSummary.extract(iter(frames)).format(),
+            *lines,
+        ]
+    )
+
+
+def serialize_error(error: BaseException, _seen: Optional[set] = None) -> Dict[str, Any]:
+    """Safely serialize an exception (and its cause, if any) for logging."""
+    serialized: Dict[str, Any] = {
         "type": type(error).__name__,
         "message": str(error),
-        "traceback": traceback.format_exception(type(error), error, error.__traceback__),
+        "traceback": _format_traceback(error),
     }
 
+    _seen = _seen or set()
+    _seen.add(id(error))
+    cause = error.__cause__ or (None if error.__suppress_context__ else error.__context__)
+    if cause is not None and id(cause) not in _seen:
+        serialized["cause"] = serialize_error(cause, _seen)
+
+    return serialized
+
 
 def add_trace_context(
     logger: logging.Logger, method_name: str, event_dict: Dict[str, Any]
 ) -> Dict[str, Any]:
-    """Structlog processor to add trace context."""
-    event_dict.update(get_trace_context())
+    """Structlog processor to add trace context (no-op until tracing is configured)."""
+    if _is_tracing_enabled():
+        event_dict.update(get_trace_context())
     return event_dict
 
 
@@ -90,16 +151,27 @@ def add_service_context(
     logger: logging.Logger, method_name: str, event_dict: Dict[str, Any]
 ) -> Dict[str, Any]:
     """Structlog processor to add service context."""
-    event_dict["service"] = SERVICE_NAME
-    event_dict["environment"] = ENVIRONMENT
+    event_dict.update(_SERVICE_CTX)
     return event_dict
 
 
+# Timestamp cache: (epoch second, formatted "YYYY-MM-DDTHH:MM:SS"), replaced as a
+# whole so concurrent readers never pair a new second with an old string
+_ts_sec_cache: Tuple[int, str] = (0, "")
+
+
 def add_timestamp(
     logger: logging.Logger, method_name: str, event_dict: Dict[str, Any]
 ) -> Dict[str, Any]:
-    """Structlog processor to add ISO timestamp."""
-    event_dict["timestamp"] = datetime.now(timezone.utc).isoformat()
+    """Structlog processor to add ISO timestamp (UTC, microsecond precision)."""
+    global _ts_sec_cache
+    ns = time.time_ns()
+    sec = ns // 1_000_000_000
+    cached = _ts_sec_cache
+    if sec != cached[0]:
+        cached = (sec, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec)))
+        _ts_sec_cache = cached
+    event_dict["timestamp"] = f"{cached[1]}.{(ns % 1_000_000_000) // 1000:06d}Z"
     return event_dict
 
 
@@ -114,39 +186,150 @@ def serialize_exceptions(
     return event_dict
 
 
+def _orjson_dumps(obj: Any, option: int = 0, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize with orjson, falling back to json for values it rejects (e.g. ints over 64 bits)."""
+    try:
+        return orjson.dumps(obj, default=default, option=option)
+    except TypeError:
+        return json.dumps(obj, default=default).encode("utf-8")
+
+
+class BufferedBytesLogger:
+    """
+    Structlog logger that buffers lines and writes them to stdout in batches.
+
+    A daemon thread flushes every LOG_FLUSH_INTERVAL seconds (and the buffer
+    flushes itself when full), so bursts of logs cost a few write() syscalls
+    instead of one per line. Remaining output is flushed at exit.
+
+    Threads do not survive fork(), so a forked child (e.g. a preloaded gunicorn
+    worker) gets a fresh buffer and flusher; lines the parent had buffered are
+    left for the parent to write.
+    """
+
+    def __init__(self, buffer_size: int = 65536) -> None:
+        self._buffer_size = buffer_size
+        self._start()
+        atexit.register(self.flush)
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._start)
+
+    def _start(self) -> None:
+        self._buf = bytearray()
+        self._lock = threading.Lock()
+        threading.Thread(target=self._flush_loop, name="log-flusher", daemon=True).start()
+
+    def msg(self, message: Any) -> None:
+        """Write *message* (bytes or str) as one line."""
+        if isinstance(message, str):
+            message = message.encode("utf-8")
+        with self._lock:
+            self._buf += message
+            self._buf += b"\n"
+            if len(self._buf) >= self._buffer_size:
+                self._write_locked()
+
+    log = debug = info = warn = warning = error = critical = exception = fatal = msg
+
+    def flush(self) -> None:
+        """Flush buffered output to stdout."""
+        with self._lock:
+            self._write_locked()
+
+    def _write_locked(self) -> None:
+        if not self._buf:
+            return
+        data = bytes(self._buf)
+        self._buf.clear()
+        try:
+            sys.stdout.buffer.write(data)
+            sys.stdout.buffer.flush()
+        except (OSError, ValueError):
+            pass
+
+    def _flush_loop(self) -> None:
+        while True:
+            time.sleep(LOG_FLUSH_INTERVAL)
+            self.flush()
+
+
 # Configure structlog
-shared_processors = [
-    structlog.contextvars.merge_contextvars,
+# Level filtering happens in the bound logger (make_filtering_bound_logger below),
+# so filtered-out calls never reach these processors. Cheap processors run first,
+# expensive ones (trace lookup, exception/stack rendering) last.
+shared_processors = (
     structlog.stdlib.add_log_level,
+    structlog.contextvars.merge_contextvars,
     add_timestamp,
     add_service_context,
+    structlog.processors.UnicodeDecoder(),
     add_trace_context,
     serialize_exceptions,
-    structlog.processors.StackInfoRenderer(),
-    structlog.processors.UnicodeDecoder(),
-]
+)
+if LOG_STACK_INFO:
+    shared_processors = (*shared_processors, structlog.processors.StackInfoRenderer())
+
+logger_factory = structlog.PrintLoggerFactory()
 
 if IS_DEVELOPMENT:
     # Pretty printing for development
-    processors = shared_processors + [
+    processors = (
+        *shared_processors,
         structlog.dev.ConsoleRenderer(colors=True),
-    ]
+    )
+elif orjson is not None:
+    # JSON output for production, rendered straight to bytes by orjson
+    processors = (
+        *shared_processors,
+        structlog.processors.format_exc_info,
+        structlog.processors.JSONRenderer(
+            serializer=_orjson_dumps,
+            option=orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS,
+        ),
+    )
+    logger_factory = structlog.BytesLoggerFactory()
 else:
     # JSON output for production
-    processors = shared_processors + [
+    processors = (
+        *shared_processors,
         structlog.processors.format_exc_info,
         structlog.processors.JSONRenderer(),
-    ]
-
-structlog.configure(
-    processors=processors,
-    wrapper_class=structlog.make_filtering_bound_logger(
-        getattr(logging, LOG_LEVEL, logging.INFO)
-    ),
-    context_class=dict,
-    logger_factory=structlog.PrintLoggerFactory(),
-    cache_logger_on_first_use=True,
-)
+    )
+
+if LOG_BUFFERED:
+    _buffered_logger = BufferedBytesLogger()
+
+    def logger_factory(*args: Any) -> BufferedBytesLogger:
+        return _buffered_logger
+
+_configured = False
+
+
+def configure_logging() -> None:
+    """
+    Apply the structlog configuration. Runs at import; later calls are no-ops.
+
+    Reconfiguring after loggers have been cached (cache_logger_on_first_use)
+    would leave those loggers on the old processor chain, so this module
+    configures structlog exactly once.
+    """
+    global _configured
+    if _configured:
+        return
+    structlog.configure(
+        # structlog (e.g. testing.capture_logs) mutates the configured chain, so hand it a list
+        processors=list(processors),
+        wrapper_class=structlog.make_filtering_bound_logger(
+            getattr(logging, LOG_LEVEL, logging.INFO)
+        ),
+        context_class=dict,
+        logger_factory=logger_factory,
+        cache_logger_on_first_use=True,
+    )
+    _configured = True
+
+
+configure_logging()
 
 # Get the configured logger
 logger = structlog.get_logger()
@@ -212,56 +395,56 @@ def timed(
             await asyncio.sleep(1)
     """
     effective_log = log or logger
+    # Level filtering is fixed at configure time, so decide once per decorator
+    log_completion = effective_log.is_enabled_for(getattr(logging, level.upper(), logging.INFO))
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
-        @wraps(func)
-        def sync_wrapper(*args: Any, **kwargs: Any) -> T:
-            start = time.perf_counter()
-            try:
-                result = func(*args, **kwargs)
-                duration_ms = (time.perf_counter() - start) * 1000
-                getattr(effective_log, level)(
-                    f"{func.__name__} completed",
-                    function=func.__name__,
-                    duration_ms=round(duration_ms, 2),
-                )
+        name = func.__name__
+        log_completed = getattr(effective_log, level)
+
+        def on_error(start: int, e: Exception) -> None:
+            effective_log.error(
+                f"{name} failed",
+                function=name,
+                duration_ms=round((time.perf_counter_ns() - start) / 1_000_000, 2),
+                error=e,
+            )
+
+        def on_success(start: int) -> None:
+            log_completed(
+                f"{name} completed",
+                function=name,
+                duration_ms=round((time.perf_counter_ns() - start) / 1_000_000, 2),
+            )
+
+        if asyncio.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> T:
+                start = time.perf_counter_ns()
+                try:
+                    result = await func(*args, **kwargs)  # type: ignore
+                except Exception as e:
+                    on_error(start, e)
+                    raise
+                if log_completion:
+                    on_success(start)
                 return result
-            except Exception as e:
-                duration_ms = (time.perf_counter() - start) * 1000
-                effective_log.error(
-                    f"{func.__name__} failed",
-                    function=func.__name__,
-                    duration_ms=round(duration_ms, 2),
-                    error=e,
-                )
-                raise
+
+            return async_wrapper  # type: ignore
 
         @wraps(func)
-        async def async_wrapper(*args: Any, **kwargs: Any) -> T:
-            start = time.perf_counter()
+        def sync_wrapper(*args: Any, **kwargs: Any) -> T:
+            start = time.perf_counter_ns()
             try:
-                result = await func(*args, **kwargs)  # type: ignore
-                duration_ms = (time.perf_counter() - start) * 1000
-                getattr(effective_log, level)(
-                    f"{func.__name__} completed",
-                    function=func.__name__,
-                    duration_ms=round(duration_ms, 2),
-                )
-                return result
+                result = func(*args, **kwargs)
             except Exception as e:
-                duration_ms = (time.perf_counter() - start) * 1000
-                effective_log.error(
-                    f"{func.__name__} failed",
-                    function=func.__name__,
-                    duration_ms=round(duration_ms, 2),
-                    error=e,
-                )
+                on_error(start, e)
                 raise
+            if log_completion:
+                on_success(start)
+            return result
 
-        import asyncio
-
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper  # type: ignore
         return sync_wrapper
 
     return decorator
@@ -290,6 +473,16 @@ def log_error(
     )
 
 
+def _log_request_completed(log: Any, status_code: int, duration_ms: float) -> None:
+    """Log request completion at a level matching the response status."""
+    log_level = "error" if status_code >= 500 else "warn" if status_code >= 400 else "info"
+    getattr(log, log_level)(
+        "Request completed",
+        status_code=status_code,
+        duration_ms=round(duration_ms, 2),
+    )
+
+
 # FastAPI middleware for request logging
 def fastapi_logging_middleware():
     """
@@ -324,13 +517,10 @@ def fastapi_logging_middleware():
             response = await call_next(request)
             duration_ms = (time.perf_counter() - start) * 1000
 
-            log_level = (
-                "error" if response.status_code >= 500 else "warn" if response.status_code >= 400 else "info"
-            )
-            getattr(logger, log_level)(
-                "Request completed",
-                status_code=response.status_code,
-                duration_ms=round(duration_ms, 2),
+            # Log after handing the response back; call_soon runs the callback in a
+            # copy of the current context, so the bound request context is kept
+            asyncio.get_running_loop().call_soon(
+                _log_request_completed, logger, response.status_code, duration_ms
             )
 
             response.headers["x-request-id"] = request_id
@@ -376,13 +566,6 @@ def flask_logging_middleware(app: Any) -> None:
     @app.after_request
     def after_request(response):
         duration_ms = (time.perf_counter() - g.start_time) * 1000
-        log_level = (
-            "error" if response.status_code >= 500 else "warn" if response.status_code >= 400 else "info"
-        )
-        getattr(g.log, log_level)(
-            "Request completed",
-            status_code=response.status_code,
-            duration_ms=round(duration_ms, 2),
-        )
+        _log_request_completed(g.log, response.status_code, duration_ms)
         response.headers["x-request-id"] = g.request_id
         return response
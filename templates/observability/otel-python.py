@@ -4,15 +4,41 @@ OpenTelemetry Python Initialization
 Provides distributed tracing, metrics, and logging for Python applications.
 Must be imported FIRST, before any other imports.
 
+The SDK (exporters, providers, auto-instrumentation) is set up when the module
+is imported. With OTEL_LAZY_INIT=true setup is instead deferred to first use -
+get_tracer(), get_meter(), span(), traced(), create_counter(), the instrument_*
+helpers - or an explicit init_otel() call. Code that only uses the plain
+OpenTelemetry API or relies on auto-instrumentation must then call init_otel().
+
 Usage:
     # At the very top of your entry file (e.g., main.py)
-    import otel  # noqa: F401 - side effects only
+    import otel
+
+    # With OTEL_LAZY_INIT=true, initialize explicitly at startup instead:
+    otel.init_otel()
 
 Environment Variables:
+    OTEL_ENABLED - Set to "false" to skip SDK setup entirely (default: true)
+    OTEL_LAZY_INIT - Set to "true" to defer SDK setup until first use (default: false)
     OTEL_SERVICE_NAME - Name of your service (required)
-    OTEL_EXPORTER_OTLP_ENDPOINT - OTLP endpoint (default: http://localhost:4318)
-    OTEL_EXPORTER_OTLP_HEADERS - Headers for OTLP endpoint (optional, JSON format)
+    OTEL_EXPORTER_OTLP_PROTOCOL - "grpc" or "http/protobuf" (default: grpc)
+    OTEL_EXPORTER_OTLP_ENDPOINT - OTLP endpoint (default: http://localhost:4317 for gRPC,
+        http://localhost:4318 for HTTP)
+    OTEL_EXPORTER_OTLP_COMPRESSION - "gzip", "deflate" or "none" (default: gzip)
+    OTEL_EXPORTER_OTLP_METRICS_TEMPORALITY_PREFERENCE - "delta" (counters and histograms),
+        "cumulative" or "lowmemory" (default: delta; use cumulative for Prometheus-style backends)
+    OTEL_EXPORTER_OTLP_POOL_SIZE - Number of span exporters (connections) to round-robin
+        batches across (default: 1)
+    OTEL_EXPORTER_OTLP_HEADERS - Headers for OTLP endpoint (optional, key1=value1,key2=value2)
+    OTEL_RESOURCE_ATTRIBUTES - Extra resource attributes (optional, key1=value1,key2=value2)
     OTEL_LOG_LEVEL - Logging level (default: INFO)
+    OTEL_PY_INSTRUMENT_REQUESTS - Auto-instrument requests (default: true)
+    OTEL_PY_INSTRUMENT_URLLIB3 - Auto-instrument urllib3 (default: false; requests already
+        goes through urllib3, so enable only for direct urllib3 use)
+    OTEL_BSP_MAX_QUEUE_SIZE - Max spans buffered before dropping (default: 4096)
+    OTEL_BSP_SCHEDULE_DELAY - Delay between batch exports in ms (default: 1000)
+    OTEL_BSP_MAX_EXPORT_BATCH_SIZE - Max spans per export batch (default: 256)
+    OTEL_BSP_EXPORT_TIMEOUT - Export timeout in ms (default: 10000)
     ENVIRONMENT - Environment name (default: development)
 
 Installation:
@@ -22,25 +48,28 @@ Installation:
         opentelemetry-instrumentation-flask opentelemetry-instrumentation-sqlalchemy
 """
 
+import asyncio
 import atexit
-import json
+import itertools
 import logging
 import os
-from contextlib import contextmanager
+import threading
+import types
+from collections import OrderedDict
 from functools import wraps
-from typing import Any, Callable, Dict, Generator, Optional, TypeVar
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Type, TypeVar
+from urllib.parse import unquote
 
 from opentelemetry import metrics, trace
-from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
-from opentelemetry.instrumentation.requests import RequestsInstrumentor
-from opentelemetry.instrumentation.urllib3 import URLLib3Instrumentor
+from opentelemetry.context import Context
 from opentelemetry.metrics import Counter, Histogram, Meter
+from opentelemetry.sdk.metrics import Counter as SdkCounter
+from opentelemetry.sdk.metrics import Histogram as SdkHistogram
 from opentelemetry.sdk.metrics import MeterProvider
-from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+from opentelemetry.sdk.metrics.export import AggregationTemporality, PeriodicExportingMetricReader
 from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExporter, SpanExportResult
 from opentelemetry.semconv.resource import ResourceAttributes
 from opentelemetry.trace import Span, SpanKind, Status, StatusCode, Tracer
 
@@ -49,104 +78,416 @@ log_level = os.getenv("OTEL_LOG_LEVEL", "INFO").upper()
 logging.basicConfig(level=getattr(logging, log_level, logging.INFO))
 logger = logging.getLogger(__name__)
 
+OTEL_ENABLED = os.getenv("OTEL_ENABLED", "true").lower() == "true"
+LAZY_INIT = os.getenv("OTEL_LAZY_INIT", "false").lower() == "true"
+INSTRUMENT_REQUESTS = os.getenv("OTEL_PY_INSTRUMENT_REQUESTS", "true").lower() == "true"
+INSTRUMENT_URLLIB3 = os.getenv("OTEL_PY_INSTRUMENT_URLLIB3", "false").lower() == "true"
+
+
+def _parse_headers(value: str) -> Dict[str, str]:
+    """
+    Parse the spec's "key1=value1,key2=value2" header format (values may be URL-encoded).
+
+    Header names are lower-cased: gRPC rejects upper-case metadata keys.
+    """
+    return {
+        key.strip().lower(): unquote(val.strip())
+        for key, _, val in (item.partition("=") for item in value.split(",") if "=" in item)
+    }
+
+
 # Service metadata
 SERVICE_NAME = os.getenv("OTEL_SERVICE_NAME", "unknown-service")
 SERVICE_VERSION = os.getenv("SERVICE_VERSION", "0.0.0")
 ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
 
 # OTLP endpoint configuration
-OTLP_ENDPOINT = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4318")
-OTLP_HEADERS = json.loads(os.getenv("OTEL_EXPORTER_OTLP_HEADERS", "{}"))
-
-# Create resource with service information
-resource = Resource.create(
-    {
-        ResourceAttributes.SERVICE_NAME: SERVICE_NAME,
-        ResourceAttributes.SERVICE_VERSION: SERVICE_VERSION,
-        ResourceAttributes.DEPLOYMENT_ENVIRONMENT: ENVIRONMENT,
-    }
+OTLP_PROTOCOL = os.getenv("OTEL_EXPORTER_OTLP_PROTOCOL", "grpc")
+OTLP_ENDPOINT = os.getenv(
+    "OTEL_EXPORTER_OTLP_ENDPOINT",
+    "http://localhost:4317" if OTLP_PROTOCOL == "grpc" else "http://localhost:4318",
 )
+OTLP_HEADERS = _parse_headers(os.getenv("OTEL_EXPORTER_OTLP_HEADERS", ""))
+OTLP_COMPRESSION = os.getenv("OTEL_EXPORTER_OTLP_COMPRESSION", "gzip").lower()
+if OTLP_COMPRESSION not in ("gzip", "deflate", "none"):
+    logger.warning("Unsupported OTEL_EXPORTER_OTLP_COMPRESSION %r, exporting uncompressed", OTLP_COMPRESSION)
+    OTLP_COMPRESSION = "none"
+METRICS_TEMPORALITY = os.getenv("OTEL_EXPORTER_OTLP_METRICS_TEMPORALITY_PREFERENCE", "delta").lower()
+OTLP_POOL_SIZE = max(1, int(os.getenv("OTEL_EXPORTER_OTLP_POOL_SIZE", "1")))
+
+if OTLP_PROTOCOL == "grpc":
+    TRACES_ENDPOINT = METRICS_ENDPOINT = OTLP_ENDPOINT
+else:
+    TRACES_ENDPOINT = f"{OTLP_ENDPOINT}/v1/traces"
+    METRICS_ENDPOINT = f"{OTLP_ENDPOINT}/v1/metrics"
+
+# Batch span processor tuning (SDK defaults drop spans and add latency under bursts)
+BSP_MAX_QUEUE_SIZE = int(os.getenv("OTEL_BSP_MAX_QUEUE_SIZE", "4096"))
+BSP_SCHEDULE_DELAY = int(os.getenv("OTEL_BSP_SCHEDULE_DELAY", "1000"))
+BSP_MAX_EXPORT_BATCH_SIZE = int(os.getenv("OTEL_BSP_MAX_EXPORT_BATCH_SIZE", "256"))
+BSP_EXPORT_TIMEOUT = int(os.getenv("OTEL_BSP_EXPORT_TIMEOUT", "10000"))
+
+
+class PoolSpanExporter(SpanExporter):
+    """
+    Round-robins span batches across several exporters.
 
-# Configure trace provider
-trace_exporter = OTLPSpanExporter(
-    endpoint=f"{OTLP_ENDPOINT}/v1/traces",
-    headers=OTLP_HEADERS,
-)
+    Each exporter holds its own connection, so batches are spread over
+    several connections (and collector replicas behind a load balancer)
+    instead of all going down one long-lived gRPC/HTTP connection. The batch
+    processor still exports one batch at a time, so this spreads load rather
+    than adding export parallelism.
+    """
 
-tracer_provider = TracerProvider(resource=resource)
-tracer_provider.add_span_processor(BatchSpanProcessor(trace_exporter))
-trace.set_tracer_provider(tracer_provider)
+    def __init__(self, exporters: Sequence[SpanExporter]) -> None:
+        self._exporters: List[SpanExporter] = list(exporters)
+        self._counter = itertools.count()
 
-# Configure metrics provider
-metric_exporter = OTLPMetricExporter(
-    endpoint=f"{OTLP_ENDPOINT}/v1/metrics",
-    headers=OTLP_HEADERS,
-)
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        index = next(self._counter) % len(self._exporters)
+        return self._exporters[index].export(spans)
+
+    def shutdown(self) -> None:
+        for exporter in self._exporters:
+            exporter.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        # Flush every exporter, even after one fails
+        results = [exporter.force_flush(timeout_millis) for exporter in self._exporters]
+        return all(results)
 
-metric_reader = PeriodicExportingMetricReader(
-    exporter=metric_exporter,
-    export_interval_millis=60000,  # Export metrics every 60 seconds
+
+# SDK state, populated by init_otel()
+tracer_provider: Optional[TracerProvider] = None
+meter_provider: Optional[MeterProvider] = None
+tracer: Optional[Tracer] = None
+meter: Optional[Meter] = None
+_initialized = False
+_init_lock = threading.Lock()
+
+# Spans are no-ops when the SDK is disabled and nothing else installed a provider;
+# span()/traced() then skip span bookkeeping entirely
+_TRACING_ENABLED = OTEL_ENABLED or not isinstance(
+    trace.get_tracer_provider(), (trace.NoOpTracerProvider, trace.ProxyTracerProvider)
 )
 
-meter_provider = MeterProvider(resource=resource, metric_readers=[metric_reader])
-metrics.set_meter_provider(meter_provider)
 
-# Auto-instrument common libraries
-try:
-    RequestsInstrumentor().instrument()
-except Exception as e:
-    logger.debug(f"Failed to instrument requests: {e}")
+def _exporter_kwargs() -> Dict[str, Any]:
+    """Protocol-specific exporter arguments: compression, plus a pre-sized HTTP connection pool."""
+    if OTLP_PROTOCOL == "grpc":
+        import grpc
+
+        compression = {
+            "gzip": grpc.Compression.Gzip,
+            "deflate": grpc.Compression.Deflate,
+            "none": grpc.Compression.NoCompression,
+        }
+        return {"compression": compression[OTLP_COMPRESSION]}
+
+    import requests
+    from opentelemetry.exporter.otlp.proto.http import Compression
+    from requests.adapters import HTTPAdapter
+
+    # Larger pool than requests' default of 10 so concurrent exports don't queue on connect;
+    # retries are left to the exporter's own backoff
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return {"compression": Compression(OTLP_COMPRESSION), "session": session}
+
+
+def _init_sdk() -> None:
+    """Create exporters and providers, register them globally and auto-instrument."""
+    global tracer_provider, meter_provider
+
+    if OTLP_PROTOCOL == "grpc":
+        from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+    else:
+        from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+    # Create resource with service information. Resource.create() also adds the
+    # telemetry.sdk.* attributes, a per-process service.instance.id (needed to
+    # tell replicas' delta metrics apart) and OTEL_RESOURCE_ATTRIBUTES.
+    resource = Resource.create(
+        {
+            ResourceAttributes.SERVICE_NAME: SERVICE_NAME,
+            ResourceAttributes.SERVICE_VERSION: SERVICE_VERSION,
+            ResourceAttributes.DEPLOYMENT_ENVIRONMENT: ENVIRONMENT,
+        }
+    )
+
+    # Configure trace provider
+    pool_kwargs: Dict[str, Any] = {}
+    if OTLP_PROTOCOL == "grpc" and OTLP_POOL_SIZE > 1:
+        # gRPC channels with identical arguments share one connection through the
+        # global subchannel pool; a local pool gives each exporter its own
+        pool_kwargs["channel_options"] = (("grpc.use_local_subchannel_pool", 1),)
+    trace_exporters = [
+        OTLPSpanExporter(
+            endpoint=TRACES_ENDPOINT, headers=OTLP_HEADERS, **_exporter_kwargs(), **pool_kwargs
+        )
+        for _ in range(OTLP_POOL_SIZE)
+    ]
+    trace_exporter = trace_exporters[0] if OTLP_POOL_SIZE == 1 else PoolSpanExporter(trace_exporters)
+
+    # shutdown_on_exit=False: our atexit shutdown() stops both providers in parallel
+    tracer_provider = TracerProvider(resource=resource, shutdown_on_exit=False)
+    tracer_provider.add_span_processor(
+        BatchSpanProcessor(
+            trace_exporter,
+            max_queue_size=BSP_MAX_QUEUE_SIZE,
+            schedule_delay_millis=BSP_SCHEDULE_DELAY,
+            max_export_batch_size=BSP_MAX_EXPORT_BATCH_SIZE,
+            export_timeout_millis=BSP_EXPORT_TIMEOUT,
+        )
+    )
+    trace.set_tracer_provider(tracer_provider)
+
+    # Configure metrics provider. Delta temporality ships only the increments
+    # since the last export instead of re-serializing full cumulative state;
+    # other preferences are resolved by the exporter from the same env var.
+    metric_kwargs = _exporter_kwargs()
+    if METRICS_TEMPORALITY == "delta":
+        metric_kwargs["preferred_temporality"] = {
+            SdkCounter: AggregationTemporality.DELTA,
+            SdkHistogram: AggregationTemporality.DELTA,
+        }
+    metric_exporter = OTLPMetricExporter(
+        endpoint=METRICS_ENDPOINT,
+        headers=OTLP_HEADERS,
+        **metric_kwargs,
+    )
+
+    metric_reader = PeriodicExportingMetricReader(
+        exporter=metric_exporter,
+        export_interval_millis=60000,  # Export metrics every 60 seconds
+    )
+
+    meter_provider = MeterProvider(
+        resource=resource, metric_readers=[metric_reader], shutdown_on_exit=False
+    )
+    metrics.set_meter_provider(meter_provider)
+
+    enable_http_instrumentation()
+
+
+def enable_http_instrumentation(
+    requests: bool = INSTRUMENT_REQUESTS,
+    urllib3: bool = INSTRUMENT_URLLIB3,
+) -> None:
+    """
+    Auto-instrument outbound HTTP client libraries.
+
+    Called during SDK initialization with the OTEL_PY_INSTRUMENT_* flags.
+    Services that make no outbound HTTP calls can turn both flags off to
+    skip the monkey-patching and per-request overhead.
+
+    urllib3 is off by default: requests is built on it, so instrumenting both
+    produces two spans and two context injections per outbound call.
+    """
+    if requests:
+        try:
+            from opentelemetry.instrumentation.requests import RequestsInstrumentor
+
+            RequestsInstrumentor().instrument()
+        except Exception as e:
+            logger.debug("Failed to instrument requests: %s", e)
+
+    if urllib3:
+        try:
+            from opentelemetry.instrumentation.urllib3 import URLLib3Instrumentor
+
+            URLLib3Instrumentor().instrument()
+        except Exception as e:
+            logger.debug("Failed to instrument urllib3: %s", e)
+
+
+def init_otel() -> None:
+    """
+    Initialize OpenTelemetry. Safe to call repeatedly; only the first call does work.
+
+    With OTEL_ENABLED=false no SDK objects are created and the API's no-op
+    tracer and meter are used. If SDK setup fails the error is logged once and
+    the no-op tracer and meter are used as well, so instrumented code keeps
+    running instead of retrying (and raising) on every call.
+    """
+    global tracer, meter, _initialized
+    if _initialized:
+        return
+    with _init_lock:
+        if _initialized:
+            return
+        try:
+            if OTEL_ENABLED:
+                _init_sdk()
+            # Get tracer and meter instances
+            tracer = trace.get_tracer(SERVICE_NAME, SERVICE_VERSION)
+            meter = metrics.get_meter(SERVICE_NAME, SERVICE_VERSION)
+        except Exception as e:
+            logger.error("Failed to initialize OpenTelemetry SDK, telemetry disabled: %s", e)
+            tracer = trace.NoOpTracer()
+            meter = metrics.NoOpMeter(SERVICE_NAME, SERVICE_VERSION)
+        _initialized = True
+
+
+def get_tracer() -> Tracer:
+    """Get the service tracer, initializing OpenTelemetry on first use."""
+    if not _initialized:
+        init_otel()
+    return tracer  # type: ignore[return-value]
 
-try:
-    URLLib3Instrumentor().instrument()
-except Exception as e:
-    logger.debug(f"Failed to instrument urllib3: {e}")
 
-# Get tracer and meter instances
-tracer: Tracer = trace.get_tracer(SERVICE_NAME, SERVICE_VERSION)
-meter: Meter = metrics.get_meter(SERVICE_NAME, SERVICE_VERSION)
+def get_meter() -> Meter:
+    """Get the service meter, initializing OpenTelemetry on first use."""
+    if not _initialized:
+        init_otel()
+    return meter  # type: ignore[return-value]
 
 
 def shutdown():
-    """Gracefully shutdown OpenTelemetry providers."""
-    try:
-        tracer_provider.shutdown()
-        meter_provider.shutdown()
+    """
+    Gracefully shutdown OpenTelemetry providers.
+
+    Both providers flush and join their exporter threads; they are shut down
+    concurrently so exit waits for the slower of the two, not their sum.
+    """
+    # Either may be missing if SDK setup failed part-way
+    providers = [p for p in (tracer_provider, meter_provider) if p is not None]
+    if not providers:
+        return
+    # Plain threads rather than an executor: this runs from atexit, after which
+    # concurrent.futures refuses new work
+    errors: List[Exception] = []
+
+    def _shutdown(provider: Any) -> None:
+        try:
+            provider.shutdown()
+        except Exception as e:
+            errors.append(e)
+
+    threads = []
+    for provider in providers:
+        t = threading.Thread(target=_shutdown, args=(provider,), name="otel-shutdown", daemon=True)
+        try:
+            t.start()
+        except RuntimeError:
+            # Python 3.12.0/3.12.1 refuse new threads in atexit handlers: shut down serially
+            _shutdown(provider)
+        else:
+            threads.append(t)
+    for t in threads:
+        t.join()
+    if errors:
+        logger.error("Error shutting down OpenTelemetry SDK: %s", errors[0])
+    else:
         logger.info("OpenTelemetry SDK shut down successfully")
-    except Exception as e:
-        logger.error(f"Error shutting down OpenTelemetry SDK: {e}")
 
 
 atexit.register(shutdown)
 
+if not LAZY_INIT:
+    init_otel()
+
 # Type variable for generic function return types
 T = TypeVar("T")
 
 
-@contextmanager
-def span(
-    name: str,
-    attributes: Optional[Dict[str, Any]] = None,
-    kind: SpanKind = SpanKind.INTERNAL,
-) -> Generator[Span, None, None]:
+# Exceptions used for control flow; not recorded as span errors by default
+_CONTROL_FLOW_EXCEPTIONS: Tuple[Type[BaseException], ...] = (asyncio.CancelledError, GeneratorExit)
+
+
+def _record_error(s: Span, e: BaseException) -> None:
+    s.set_status(Status(StatusCode.ERROR, str(e)))
+    s.record_exception(e)
+
+
+class _Span:
     """
     Context manager for creating a custom span.
 
+    Exceptions in exclude_exceptions (control flow such as task cancellation)
+    propagate without being recorded on the span or marking it as an error.
+
+    A plain class rather than a @contextmanager generator: no generator frame
+    or send/throw machinery per span, and __slots__ avoids a __dict__.
+
     Example:
         with span("process_order", {"order.id": order_id}) as s:
             s.add_event("order_validated")
             process_order(order_id)
     """
-    with tracer.start_as_current_span(name, kind=kind) as s:
+
+    __slots__ = ("_name", "_attributes", "_kind", "_exclude_exceptions", "_cm", "_span")
+
+    def __init__(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        kind: SpanKind = SpanKind.INTERNAL,
+        exclude_exceptions: Tuple[Type[BaseException], ...] = _CONTROL_FLOW_EXCEPTIONS,
+    ) -> None:
+        self._name = name
+        self._attributes = attributes
+        self._kind = kind
+        self._exclude_exceptions = exclude_exceptions
+        self._cm: Any = None
+        self._span: Span = trace.INVALID_SPAN
+
+    def __enter__(self) -> Span:
+        if not _TRACING_ENABLED:
+            return self._span
+
+        # Attributes are applied during span construction; status is left UNSET on
+        # success (the OTel default) and only set on error. Exception recording is
+        # done here rather than by the SDK so it happens once and can be skipped.
+        self._cm = get_tracer().start_as_current_span(
+            self._name,
+            kind=self._kind,
+            attributes=self._attributes,
+            record_exception=False,
+            set_status_on_exception=False,
+        )
+        self._span = self._cm.__enter__()
+        return self._span
+
+    def __exit__(self, exc_type: Any, exc: Optional[BaseException], tb: Any) -> Any:
+        if self._cm is None:
+            return None
+        if exc is not None and not isinstance(exc, self._exclude_exceptions):
+            _record_error(self._span, exc)
+        return self._cm.__exit__(exc_type, exc, tb)
+
+
+span = _Span
+
+
+def start_detached(
+    name: str,
+    parent_ctx: Optional[Context] = None,
+    attributes: Optional[Dict[str, Any]] = None,
+    kind: SpanKind = SpanKind.INTERNAL,
+) -> Span:
+    """
+    Start a span without making it the current span.
+
+    Skips the context attach/detach that span() does on entry and exit, which
+    serializes on the context var under heavy asyncio concurrency. Pass the
+    parent context explicitly and end the span yourself.
+
+    Example:
+        parent = trace.set_span_in_context(request_span)
+        s = start_detached("fetch_inventory", parent, {"sku": sku})
         try:
-            if attributes:
-                s.set_attributes(attributes)
-            yield s
-            s.set_status(Status(StatusCode.OK))
-        except Exception as e:
-            s.set_status(Status(StatusCode.ERROR, str(e)))
-            s.record_exception(e)
-            raise
+            await fetch_inventory(sku)
+        finally:
+            s.end()
+    """
+    if not _TRACING_ENABLED:
+        return trace.INVALID_SPAN
+    return get_tracer().start_span(name, context=parent_ctx, kind=kind, attributes=attributes)
 
 
 def traced(
@@ -167,22 +508,55 @@ def traced(
     """
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
-        span_name = name or func.__name__
+        if not _TRACING_ENABLED:
+            return func
 
-        @wraps(func)
-        def sync_wrapper(*args: Any, **kwargs: Any) -> T:
-            with span(span_name, attributes):
-                return func(*args, **kwargs)
+        span_name = name or func.__name__
+        # Bound once per decorated function, on its first call (decorating must not
+        # initialize the SDK): the wrappers then start spans directly instead of
+        # going through span() and a global tracer lookup per call
+        start_span: Optional[Callable[..., Any]] = None
 
-        @wraps(func)
-        async def async_wrapper(*args: Any, **kwargs: Any) -> T:
-            with span(span_name, attributes):
-                return await func(*args, **kwargs)  # type: ignore
+        if asyncio.iscoroutinefunction(func):
 
-        import asyncio
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> T:
+                nonlocal start_span
+                if start_span is None:
+                    start_span = get_tracer().start_as_current_span
+                with start_span(
+                    span_name,
+                    attributes=attributes,
+                    record_exception=False,
+                    set_status_on_exception=False,
+                ) as s:
+                    try:
+                        return await func(*args, **kwargs)  # type: ignore
+                    except BaseException as e:
+                        if not isinstance(e, _CONTROL_FLOW_EXCEPTIONS):
+                            _record_error(s, e)
+                        raise
 
-        if asyncio.iscoroutinefunction(func):
             return async_wrapper  # type: ignore
+
+        @wraps(func)
+        def sync_wrapper(*args: Any, **kwargs: Any) -> T:
+            nonlocal start_span
+            if start_span is None:
+                start_span = get_tracer().start_as_current_span
+            with start_span(
+                span_name,
+                attributes=attributes,
+                record_exception=False,
+                set_status_on_exception=False,
+            ) as s:
+                try:
+                    return func(*args, **kwargs)
+                except BaseException as e:
+                    if not isinstance(e, _CONTROL_FLOW_EXCEPTIONS):
+                        _record_error(s, e)
+                    raise
+
         return sync_wrapper
 
     return decorator
@@ -196,7 +570,7 @@ def create_counter(name: str, description: str, unit: str = "1") -> Counter:
         order_counter = create_counter("orders.created", "Number of orders created")
         order_counter.add(1, {"region": "us-east"})
     """
-    return meter.create_counter(name, description=description, unit=unit)
+    return get_meter().create_counter(name, description=description, unit=unit)
 
 
 def create_histogram(name: str, description: str, unit: str = "ms") -> Histogram:
@@ -211,13 +585,20 @@ def create_histogram(name: str, description: str, unit: str = "ms") -> Histogram
         )
         latency_histogram.record(150, {"endpoint": "/api/users"})
     """
-    return meter.create_histogram(name, description=description, unit=unit)
+    return get_meter().create_histogram(name, description=description, unit=unit)
 
 
-def get_trace_context() -> Optional[Dict[str, str]]:
+# Formatted trace contexts keyed by (trace_id, span_id), oldest evicted first
+_TRACE_CONTEXT_CACHE_SIZE = 1024
+_trace_context_cache: "OrderedDict[Tuple[int, int], Mapping[str, str]]" = OrderedDict()
+
+
+def get_trace_context() -> Optional[Mapping[str, str]]:
     """
     Get current trace context for logging correlation.
 
+    The result is a read-only mapping, cached per span and shared between calls.
+
     Example:
         ctx = get_trace_context()
         if ctx:
@@ -228,10 +609,19 @@ def get_trace_context() -> Optional[Dict[str, str]]:
         return None
 
     context = current_span.get_span_context()
-    return {
-        "trace_id": format(context.trace_id, "032x"),
-        "span_id": format(context.span_id, "016x"),
-    }
+    key = (context.trace_id, context.span_id)
+    cached = _trace_context_cache.get(key)
+    if cached is None:
+        cached = types.MappingProxyType(
+            {
+                "trace_id": "%032x" % context.trace_id,
+                "span_id": "%016x" % context.span_id,
+            }
+        )
+        _trace_context_cache[key] = cached
+        if len(_trace_context_cache) > _TRACE_CONTEXT_CACHE_SIZE:
+            _trace_context_cache.popitem(last=False)
+    return cached
 
 
 def instrument_fastapi(app: Any) -> None:
@@ -243,6 +633,8 @@ def instrument_fastapi(app: Any) -> None:
         app = FastAPI()
         instrument_fastapi(app)
     """
+    init_otel()
+
     try:
         from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 
@@ -263,6 +655,8 @@ def instrument_flask(app: Any) -> None:
         app = Flask(__name__)
         instrument_flask(app)
     """
+    init_otel()
+
     try:
         from opentelemetry.instrumentation.flask import FlaskInstrumentor
 
@@ -283,6 +677,8 @@ def instrument_sqlalchemy(engine: Any) -> None:
         engine = create_engine("postgresql://...")
         instrument_sqlalchemy(engine)
     """
+    init_otel()
+
     try:
         from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
 